@@ -16,6 +16,31 @@ def generer_planning(noms_ateliers: List[str], noms_equipes: List[str]) -> pd.Da
     Returns:
         pd.DataFrame: Un DataFrame contenant le planning complet (Tours, Ateliers, etc.).
     """
+    planning_global = generer_tours(noms_ateliers, noms_equipes)
+    for tour_data in planning_global:
+        tour_data["Equipes en pause"] = ", ".join(tour_data["Equipes en pause"])
+
+    # On force l'ordre des colonnes pour éviter tout désagrément sur certains environnements
+    colonnes_ordonnees = ["Tour"] + noms_ateliers + ["Equipes en pause"]
+    df = pd.DataFrame(planning_global)
+    # Réindexation avec les colonnes dans l'ordre souhaité (et ajout si manquantes, though they shouldn't be)
+    return df.reindex(columns=colonnes_ordonnees)
+
+
+def generer_tours(noms_ateliers: List[str], noms_equipes: List[str]) -> List[Dict[str, Any]]:
+    """
+    Génère les tours du planning, un dictionnaire par tour.
+
+    Mêmes clés que les lignes de `generer_planning`, mais 'Equipes en pause' est
+    la liste triée des équipes en pause (non encore jointe en texte).
+
+    Args:
+        noms_ateliers (List[str]): La liste des noms des ateliers.
+        noms_equipes (List[str]): La liste des noms des équipes.
+
+    Returns:
+        List[Dict[str, Any]]: Les tours ('Tour', un champ par atelier, 'Equipes en pause').
+    """
     # 1. Préparation des équipes (Nombre pair nécessaire)
     equipes = noms_equipes.copy()
     if len(equipes) % 2 != 0:
@@ -171,15 +196,11 @@ def generer_planning(noms_ateliers: List[str], noms_equipes: List[str]) -> pd.Da
                     equipes_en_pause.append(m_a)
                     equipes_en_pause.append(m_b)
 
-        tour_data["Equipes en pause"] = ", ".join(sorted(equipes_en_pause))
+        tour_data["Equipes en pause"] = sorted(equipes_en_pause)
 
         planning_global.append(tour_data)
 
-    # On force l'ordre des colonnes pour éviter tout désagrément sur certains environnements
-    colonnes_ordonnees = ["Tour"] + noms_ateliers + ["Equipes en pause"]
-    df = pd.DataFrame(planning_global)
-    # Réindexation avec les colonnes dans l'ordre souhaité (et ajout si manquantes, though they shouldn't be)
-    return df.reindex(columns=colonnes_ordonnees)
+    return planning_global
 
 
 def conversions_par_equipe(df_global: pd.DataFrame) -> Dict[str, pd.DataFrame]:
@@ -0,0 +1,124 @@
+import json
+import queue
+import threading
+from typing import Any, Iterator, Optional, Set
+
+
+# Nombre maximal d'événements en attente par client avant resynchronisation
+TAILLE_TAMPON_DEFAUT = 64
+
+# Délai (secondes) sans événement avant l'envoi d'un commentaire de maintien de connexion
+DELAI_MAINTIEN = 15.0
+
+# Message envoyé à un client trop lent dont le tampon a débordé
+EVENEMENT_RESYNC = b"event: resync\ndata: {}\n\n"
+
+
+class Abonnement:
+    """
+    File d'attente bornée d'un client abonné au flux d'événements.
+    """
+    def __init__(self, taille_tampon: int):
+        self.file: "queue.Queue[bytes]" = queue.Queue(maxsize=taille_tampon)
+        self.actif = True
+        self._verrou = threading.Lock()
+
+    def deposer(self, message: bytes) -> None:
+        """
+        Dépose un message sans jamais bloquer l'émetteur.
+
+        Si le tampon est plein, les messages en attente sont abandonnés et remplacés
+        par un unique événement 'resync' : le client rechargera l'état complet.
+        """
+        with self._verrou:
+            try:
+                self.file.put_nowait(message)
+            except queue.Full:
+                try:
+                    while True:
+                        self.file.get_nowait()
+                except queue.Empty:
+                    pass
+                self.file.put_nowait(EVENEMENT_RESYNC)
+
+
+class Diffuseur:
+    """
+    Diffuseur d'événements Server-Sent Events en mémoire (un seul processus).
+
+    Chaque événement est sérialisé une seule fois puis déposé dans la file bornée
+    de chaque abonné. Un client lent ne bloque jamais les autres : son tampon est
+    vidé et remplacé par un événement 'resync' lorsqu'il déborde.
+    """
+    def __init__(self, taille_tampon: int = TAILLE_TAMPON_DEFAUT):
+        self.taille_tampon = taille_tampon
+        self.abonnements: Set[Abonnement] = set()
+        self._dernier_id = 0
+        self._verrou = threading.Lock()
+
+    def abonner(self, dernier_id: Optional[int] = None) -> Abonnement:
+        """
+        Crée et enregistre un nouvel abonnement.
+
+        Le premier message est un événement 'resync' (état complet à recharger), sauf si
+        `dernier_id` (en-tête Last-Event-ID d'une reconnexion) est le dernier identifiant
+        publié : le client n'a alors rien manqué. Le dépôt a lieu sous le verrou de
+        publication, aucun événement ne peut donc s'intercaler avant le 'resync'.
+
+        Args:
+            dernier_id (Optional[int]): Le dernier identifiant reçu par le client, s'il est connu.
+        """
+        abonnement = Abonnement(self.taille_tampon)
+        with self._verrou:
+            if dernier_id != self._dernier_id:
+                abonnement.deposer(EVENEMENT_RESYNC)
+            self.abonnements.add(abonnement)
+        return abonnement
+
+    def desabonner(self, abonnement: Abonnement) -> None:
+        """ Retire un abonnement (déconnexion du client). """
+        abonnement.actif = False
+        with self._verrou:
+            self.abonnements.discard(abonnement)
+
+    def publier(self, type_evenement: str, donnees: Any) -> int:
+        """
+        Publie un événement à tous les abonnés.
+
+        Args:
+            type_evenement (str): Le nom de l'événement SSE (ex: 'resultat', 'tour').
+            donnees (Any): Les données, sérialisables en JSON.
+
+        Returns:
+            int: L'identifiant attribué à l'événement.
+        """
+        corps = json.dumps(donnees, ensure_ascii=False, separators=(",", ":"))
+
+        # Attribution de l'identifiant et dépôt sous le même verrou : tous les abonnés
+        # reçoivent les événements dans l'ordre de leurs identifiants. Le dépôt ne
+        # bloque jamais, le verrou n'est donc tenu que le temps des copies en file.
+        with self._verrou:
+            self._dernier_id += 1
+            id_evenement = self._dernier_id
+            message = f"id: {id_evenement}\nevent: {type_evenement}\ndata: {corps}\n\n".encode("utf-8")
+            for abonnement in self.abonnements:
+                abonnement.deposer(message)
+        return id_evenement
+
+    def flux(self, abonnement: Abonnement, delai_maintien: Optional[float] = DELAI_MAINTIEN) -> Iterator[bytes]:
+        """
+        Générateur des messages d'un abonné, à servir comme corps de réponse HTTP.
+
+        Un commentaire SSE est émis après `delai_maintien` secondes d'inactivité pour
+        garder la connexion ouverte derrière les proxies. L'abonnement est retiré à la
+        fermeture du générateur (déconnexion du client).
+        """
+        try:
+            yield b"retry: 3000\n\n"
+            while abonnement.actif:
+                try:
+                    yield abonnement.file.get(timeout=delai_maintien)
+                except queue.Empty:
+                    yield b": ping\n\n"
+        finally:
+            self.desabonner(abonnement)
@@ -0,0 +1,266 @@
+"""
+Export Excel du planning par équipe (une feuille par équipe), à mémoire bornée.
+
+Le classeur est écrit directement au format OOXML (archive zip de feuilles XML,
+chaînes en ligne, styles minimaux) au lieu de passer par openpyxl. Même en mode
+write-only, openpyxl conserve chaque feuille fermée (objets Worksheet, vues,
+mise en page...) jusqu'à la sauvegarde : environ 14 Ko par équipe mesurés avec
+tracemalloc (12 Mo pour 800 équipes, près de 150 Mo pour les 10 000 noms admis à
+l'import). Ici, seuls le nom de feuille et l'entrée d'archive de chaque équipe
+restent en mémoire (moins de 1 Ko) ; `outils.memoire` et tests/test_export.py
+vérifient ce coût.
+
+Le format produit est volontairement réduit (texte et entiers, en-tête en gras) ;
+sa validité est contrôlée par les tests en relisant le classeur avec openpyxl et
+pandas. openpyxl reste utilisé pour la lecture (core.importation).
+"""
+import re
+import shutil
+import tempfile
+import zipfile
+from typing import Any, List, Dict, Iterator, Sequence, Tuple, Union, IO
+from xml.sax.saxutils import escape, quoteattr
+
+import pandas as pd
+
+# Nombre maximal de feuilles écrites simultanément (un fichier temporaire ouvert chacune,
+# avec un tampon d'écriture de 8 Ko)
+NB_FEUILLES_OUVERTES = 64
+
+# Taille (octets) au-delà de laquelle un export quitte la mémoire pour un fichier temporaire
+SEUIL_FICHIER_TEMPORAIRE = 8 * 1024 * 1024
+
+COLONNES_EQUIPE = ["Tour", "Atelier", "Adversaire"]
+
+# Caractères interdits dans un nom de feuille Excel, et caractères de contrôle interdits en XML
+CARACTERES_INTERDITS_FEUILLE = re.compile(r"[:\\/?*\[\]]")
+CARACTERES_INTERDITS_XML = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+ENTETE_XML = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# Feuille de styles minimale : style 0 normal, style 1 gras (en-têtes)
+STYLES_XML = (
+    ENTETE_XML
+    + f'<styleSheet xmlns="{NS_MAIN}">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def fichier_temporaire(seuil: int = SEUIL_FICHIER_TEMPORAIRE) -> IO[bytes]:
+    """
+    Crée un fichier binaire gardé en mémoire jusqu'à `seuil` octets puis déversé sur disque.
+    """
+    return tempfile.SpooledTemporaryFile(max_size=seuil, mode="w+b")
+
+
+def nom_feuille(equipe: str) -> str:
+    """ Nom de feuille Excel propre pour une équipe (Excel limite à 31 caractères). """
+    return CARACTERES_INTERDITS_FEUILLE.sub("", equipe)[:30] or "Equipe"
+
+
+def colonnes_matchs(planning: pd.DataFrame) -> Tuple[List[Any], List[Tuple[str, Sequence[Any]]]]:
+    """
+    Extrait une seule fois les colonnes du planning (tours et cellules de chaque atelier).
+
+    Les colonnes sont des vues sur les données du DataFrame (pas de copie). Les extraire
+    une fois pour toutes évite de recréer des Series, et les références internes de
+    pandas qui les accompagnent, à chaque relecture du planning.
+    """
+    colonnes = list(planning.columns)
+    tours = planning.iloc[:, colonnes.index("Tour")].to_numpy()
+    ateliers = [
+        (c, planning.iloc[:, i].to_numpy())
+        for i, c in enumerate(colonnes) if c not in ["Tour", "Equipes en pause"]
+    ]
+    return tours, ateliers
+
+
+def parcourir_matchs(
+    colonnes: Tuple[List[Any], List[Tuple[str, Sequence[Any]]]]
+) -> Iterator[Tuple[int, str, str, str]]:
+    """
+    Parcourt les matchs du planning tour par tour, à partir de `colonnes_matchs`.
+
+    Aucune ligne n'est matérialisée : la mémoire de travail est bornée quel que soit
+    le nombre de tours.
+
+    Yields:
+        Tuple[int, str, str, str]: (tour, atelier, equipe_a, equipe_b) pour chaque match.
+    """
+    tours, ateliers = colonnes
+    for index, tour in enumerate(tours):
+        tour = int(tour)
+        for atelier, cellules in ateliers:
+            cellule = cellules[index]
+            if not isinstance(cellule, str) or " vs " not in cellule:
+                continue
+            parts = cellule.split(" vs ")
+            if len(parts) == 2:
+                yield tour, atelier, parts[0].strip(), parts[1].strip()
+
+
+def _texte(valeur: str) -> str:
+    """ Texte échappé pour le contenu d'une cellule XML. """
+    return escape(CARACTERES_INTERDITS_XML.sub("", valeur))
+
+
+def _ligne_xml(numero: int, tour: int, atelier: str, adversaire: str) -> bytes:
+    """ Ligne de données d'une feuille équipe (Tour numérique, textes en ligne). """
+    return (
+        f'<row r="{numero}"><c r="A{numero}"><v>{tour}</v></c>'
+        f'<c r="B{numero}" t="inlineStr"><is><t>{_texte(atelier)}</t></is></c>'
+        f'<c r="C{numero}" t="inlineStr"><is><t>{_texte(adversaire)}</t></is></c></row>'
+    ).encode("utf-8")
+
+
+def _debut_feuille_xml() -> bytes:
+    """ Début d'une feuille équipe, jusqu'à la ligne d'en-tête (en gras) comprise. """
+    cellules = "".join(
+        f'<c r="{colonne}1" t="inlineStr" s="1"><is><t>{titre}</t></is></c>'
+        for colonne, titre in zip("ABC", COLONNES_EQUIPE)
+    )
+    return (ENTETE_XML + f'<worksheet xmlns="{NS_MAIN}"><sheetData><row r="1">{cellules}</row>').encode("utf-8")
+
+
+FIN_FEUILLE_XML = b"</sheetData></worksheet>"
+
+
+def _ecrire_structure(archive: zipfile.ZipFile, noms_feuilles: List[str]) -> None:
+    """ Écrit les parties communes du classeur (types, relations, classeur, styles). """
+    with archive.open("[Content_Types].xml", "w") as f:
+        f.write((
+            ENTETE_XML
+            + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        ).encode("utf-8"))
+        for n in range(1, len(noms_feuilles) + 1):
+            f.write((
+                f'<Override PartName="/xl/worksheets/sheet{n}.xml" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            ).encode("utf-8"))
+        f.write(b"</Types>")
+
+    archive.writestr("_rels/.rels", (
+        ENTETE_XML
+        + f'<Relationships xmlns="{NS_PKG_REL}">'
+        f'<Relationship Id="rId1" Type="{NS_REL}/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ))
+
+    with archive.open("xl/workbook.xml", "w") as f:
+        f.write((ENTETE_XML + f'<workbook xmlns="{NS_MAIN}" xmlns:r="{NS_REL}"><sheets>').encode("utf-8"))
+        for n, nom in enumerate(noms_feuilles, start=1):
+            f.write(f'<sheet name={quoteattr(nom)} sheetId="{n}" r:id="rId{n}"/>'.encode("utf-8"))
+        f.write(b"</sheets></workbook>")
+
+    with archive.open("xl/_rels/workbook.xml.rels", "w") as f:
+        f.write((ENTETE_XML + f'<Relationships xmlns="{NS_PKG_REL}">').encode("utf-8"))
+        for n in range(1, len(noms_feuilles) + 1):
+            f.write((
+                f'<Relationship Id="rId{n}" Type="{NS_REL}/worksheet" Target="worksheets/sheet{n}.xml"/>'
+            ).encode("utf-8"))
+        f.write((
+            f'<Relationship Id="rId{len(noms_feuilles) + 1}" Type="{NS_REL}/styles" Target="styles.xml"/>'
+            '</Relationships>'
+        ).encode("utf-8"))
+
+    archive.writestr("xl/styles.xml", STYLES_XML)
+
+
+def exporter_excel_equipes(
+    planning: pd.DataFrame,
+    destination: Union[str, IO[bytes]],
+    nb_feuilles_ouvertes: int = NB_FEUILLES_OUVERTES
+) -> None:
+    """
+    Écrit un fichier Excel avec un onglet par équipe (Tour, Atelier, Adversaire).
+
+    Produit le même contenu que `conversions_par_equipe` suivi d'un `ExcelWriter`,
+    sans DataFrame par équipe ni classeur openpyxl en mémoire : le XML de chaque
+    feuille est écrit directement dans l'archive. Les équipes sont traitées par
+    lots de `nb_feuilles_ouvertes` : pour chaque lot, le planning est relu tour par
+    tour et les feuilles du lot sont écrites dans des fichiers temporaires, puis
+    recopiées une à une dans l'archive et fermées avant le lot suivant.
+
+    La mémoire de travail est donc fixe (un lot de tampons de fichiers) ; seuls le
+    nom de feuille et l'entrée d'archive de chaque équipe (moins de 1 Ko) restent
+    en mémoire jusqu'à la fin de l'écriture.
+
+    Args:
+        planning (pd.DataFrame): Le planning global généré.
+        destination (Union[str, IO[bytes]]): Un chemin ou un fichier binaire ouvert.
+        nb_feuilles_ouvertes (int): Nombre maximal de feuilles en cours d'écriture.
+    """
+    colonnes = colonnes_matchs(planning)
+
+    # 1. Ordre des équipes (ordre de première apparition, comme conversions_par_equipe)
+    equipes: Dict[str, None] = {}
+    for _, _, eq_a, eq_b in parcourir_matchs(colonnes):
+        equipes.setdefault(eq_a)
+        equipes.setdefault(eq_b)
+    equipes.pop("FANTOME", None)
+    ordre: List[str] = list(equipes)
+
+    noms_feuilles: List[str] = []
+    noms_pris = set()
+
+    with zipfile.ZipFile(destination, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        # 2. Écriture par lots d'équipes : une relecture du planning par lot
+        for debut in range(0, len(ordre), nb_feuilles_ouvertes):
+            lot = ordre[debut:debut + nb_feuilles_ouvertes]
+            fichiers = {}
+            lignes_ecrites = {}
+            try:
+                for equipe in lot:
+                    fichiers[equipe] = tempfile.TemporaryFile()
+                    fichiers[equipe].write(_debut_feuille_xml())
+                    lignes_ecrites[equipe] = 1
+
+                for tour, atelier, eq_a, eq_b in parcourir_matchs(colonnes):
+                    for equipe, adversaire in ((eq_a, eq_b), (eq_b, eq_a)):
+                        if equipe in fichiers:
+                            lignes_ecrites[equipe] += 1
+                            fichiers[equipe].write(_ligne_xml(lignes_ecrites[equipe], tour, atelier, adversaire))
+
+                # Recopie des feuilles du lot dans l'archive, dans l'ordre des équipes
+                for equipe in lot:
+                    nom = nom_feuille(equipe)
+                    base, suffixe = nom, 1
+                    while nom.casefold() in noms_pris:
+                        nom = f"{base[:30 - len(str(suffixe))]}{suffixe}"
+                        suffixe += 1
+                    noms_pris.add(nom.casefold())
+                    noms_feuilles.append(nom)
+
+                    fichier = fichiers[equipe]
+                    fichier.write(FIN_FEUILLE_XML)
+                    fichier.seek(0)
+                    with archive.open(f"xl/worksheets/sheet{len(noms_feuilles)}.xml", "w") as sortie:
+                        shutil.copyfileobj(fichier, sortie)
+            finally:
+                for fichier in fichiers.values():
+                    fichier.close()
+
+        # Un classeur Excel doit contenir au moins une feuille
+        if not ordre:
+            noms_feuilles.append("Planning")
+            archive.writestr("xl/worksheets/sheet1.xml", _debut_feuille_xml() + FIN_FEUILLE_XML)
+
+        _ecrire_structure(archive, noms_feuilles)
@@ -0,0 +1,183 @@
+import codecs
+import csv
+import os
+from collections import Counter
+from typing import List, Iterator, Optional, IO
+
+from openpyxl import load_workbook
+
+# Nombre maximal de noms acceptés par fichier importé
+MAX_NOMS = 10000
+
+# En-têtes de colonne ignorés s'ils apparaissent en première ligne
+ENTETES = {"equipe", "equipes", "équipe", "équipes", "atelier", "ateliers", "nom", "noms", "team", "teams"}
+
+EXTENSIONS = {".csv", ".txt", ".xlsx"}
+
+# Taille (octets) de l'échantillon lu pour détecter le séparateur d'un CSV
+TAILLE_ECHANTILLON = 4096
+
+SEPARATEURS = (";", ",", "\t")
+
+# Encodages des fichiers texte, dans l'ordre d'essai : UTF-8 (avec ou sans BOM), puis
+# Windows-1252 (export Excel français « CSV (séparateur : point-virgule) »)
+ENCODAGES = ("utf-8-sig", "cp1252")
+
+
+def normaliser(nom: str) -> str:
+    """ Supprime les espaces superflus (début, fin, et espaces multiples internes). """
+    return " ".join(nom.split())
+
+
+def _sans_guillemets(ligne: str) -> str:
+    """ Retire les guillemets CSV entourant une valeur ("Durand, Martin" -> Durand, Martin). """
+    ligne = ligne.strip()
+    if len(ligne) >= 2 and ligne[0] == ligne[-1] == '"':
+        return ligne[1:-1].replace('""', '"')
+    return ligne
+
+
+def _lignes_texte(flux: IO[bytes], encodage: str, guillemets: bool = False) -> Iterator[Optional[str]]:
+    """ Un nom par ligne, sans découpage sur les virgules ou points-virgules. """
+    for ligne in codecs.iterdecode(flux, encodage):
+        ligne = ligne.rstrip("\r\n")
+        yield _sans_guillemets(ligne) if guillemets else ligne
+
+
+def _separateur_colonnes(echantillon: str, complet: bool) -> Optional[str]:
+    """
+    Détecte un CSV à plusieurs colonnes : retourne le séparateur dont le nombre de
+    colonnes le plus fréquent dans l'échantillon est au moins 2 (le plus représenté
+    s'il y en a plusieurs), sinon None. Une ligne incomplète (valeur manquante dans
+    un export de tableur) ne remet donc pas en cause le découpage.
+
+    Un séparateur toujours suivi d'une espace ("Durand, Martin") est une ponctuation
+    du nom : les exports de tableur n'en ajoutent jamais après le séparateur.
+    """
+    lignes = echantillon.splitlines()
+    if not complet:
+        # La dernière ligne de l'échantillon peut être tronquée
+        lignes = lignes[:-1]
+    lignes = [ligne for ligne in lignes if ligne.strip()]
+    if not lignes:
+        return None
+
+    meilleur, meilleure_part = None, 0.0
+    for separateur in SEPARATEURS:
+        lues = list(csv.reader(lignes, delimiter=separateur))
+        comptes = Counter(len(ligne) for ligne in lues)
+        nb_colonnes, occurrences = max(comptes.items(), key=lambda c: (c[1], c[0]))
+        if nb_colonnes < 2:
+            continue
+
+        suites = [champ for ligne in lues for champ in ligne[1:] if champ]
+        if suites and all(champ.startswith(" ") for champ in suites):
+            continue
+
+        part = occurrences / len(lues)
+        if part > meilleure_part:
+            meilleur, meilleure_part = separateur, part
+    return meilleur
+
+
+def _lignes_csv(flux: IO[bytes], encodage: str) -> Iterator[Optional[str]]:
+    """
+    Première colonne de chaque ligne d'un CSV (séparateur ';', ',' ou tabulation).
+
+    Le séparateur n'est retenu que si l'échantillon a majoritairement plus d'une
+    colonne ; sinon chaque ligne est un nom ("Durand, Martin" reste entier).
+    """
+    brut = flux.read(TAILLE_ECHANTILLON)
+    complet = len(brut) < TAILLE_ECHANTILLON
+    echantillon = codecs.getincrementaldecoder(encodage)().decode(brut, final=complet)
+    separateur = _separateur_colonnes(echantillon, complet)
+
+    # Relecture depuis le début : l'échantillon sert uniquement à détecter le format
+    flux.seek(0)
+    if separateur is None:
+        yield from _lignes_texte(flux, encodage, guillemets=True)
+        return
+    for ligne in csv.reader(codecs.iterdecode(flux, encodage), delimiter=separateur):
+        yield ligne[0] if ligne else None
+
+
+def _lignes_xlsx(flux: IO[bytes]) -> Iterator[Optional[str]]:
+    """ Première colonne de chaque ligne de la première feuille d'un classeur Excel. """
+    classeur = load_workbook(flux, read_only=True, data_only=True)
+    try:
+        feuille = classeur.worksheets[0]
+        for ligne in feuille.iter_rows(max_col=1, values_only=True):
+            valeur = ligne[0] if ligne else None
+            yield None if valeur is None else str(valeur)
+    finally:
+        classeur.close()
+
+
+def _noms(lignes: Iterator[Optional[str]], max_noms: int) -> List[str]:
+    """ Normalise et dédoublonne les noms en un seul passage, en ignorant un en-tête éventuel. """
+    noms: List[str] = []
+    deja_vus = set()
+    premiere = True
+    for valeur in lignes:
+        nom = normaliser(valeur) if valeur else ""
+        if not nom:
+            continue
+        if premiere:
+            premiere = False
+            if nom.casefold() in ENTETES:
+                continue
+
+        cle = nom.casefold()
+        if cle in deja_vus:
+            continue
+        deja_vus.add(cle)
+        noms.append(nom)
+
+        if len(noms) > max_noms:
+            lignes.close()
+            raise ValueError(f"Le fichier contient plus de {max_noms} noms.")
+
+    return noms
+
+
+def lire_noms(flux: IO[bytes], nom_fichier: str, max_noms: int = MAX_NOMS) -> List[str]:
+    """
+    Lit une liste de noms (équipes ou ateliers) depuis un fichier CSV, TXT ou XLSX.
+
+    Le fichier est parcouru ligne par ligne (openpyxl en lecture seule pour l'Excel) :
+    un fichier texte contient un nom par ligne ; pour un CSV à plusieurs colonnes et
+    pour l'Excel, seule la première colonne est retenue. Les noms sont normalisés et
+    dédoublonnés (sans tenir compte de la casse) en un seul passage. Un en-tête éventuel
+    ('Equipes', 'Ateliers', 'Nom'...) en première ligne est ignoré.
+
+    Les fichiers texte sont décodés en UTF-8, ou à défaut en Windows-1252 (export CSV
+    d'Excel en français) ; aucun caractère n'est remplacé silencieusement.
+
+    Args:
+        flux (IO[bytes]): Le fichier ouvert en binaire (doit permettre `seek` pour le CSV et l'Excel).
+        nom_fichier (str): Le nom du fichier, dont l'extension détermine le format.
+        max_noms (int): Nombre maximal de noms acceptés.
+
+    Returns:
+        List[str]: Les noms, dans l'ordre du fichier.
+
+    Raises:
+        ValueError: Si le format ou l'encodage n'est pas supporté, ou si le fichier contient trop de noms.
+    """
+    extension = os.path.splitext(nom_fichier)[1].lower()
+    if extension not in EXTENSIONS:
+        raise ValueError(f"Format non supporté : '{extension}' (attendu : CSV, TXT ou XLSX).")
+
+    if extension == ".xlsx":
+        return _noms(_lignes_xlsx(flux), max_noms)
+
+    # Décodage strict : au premier octet invalide, relecture complète avec l'encodage suivant
+    for encodage in ENCODAGES:
+        flux.seek(0)
+        lignes = _lignes_texte(flux, encodage) if extension == ".txt" else _lignes_csv(flux, encodage)
+        try:
+            return _noms(lignes, max_noms)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("Encodage du fichier non reconnu (attendu : UTF-8 ou Windows-1252).")
+
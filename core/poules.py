@@ -0,0 +1,103 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any
+
+import pandas as pd
+
+from core.algo import generer_tours
+
+# Processus de génération partagés par tous les appels, créés une seule fois (démarrés à la
+# première poule générée puis réutilisés). Contexte 'spawn' : le serveur multi-thread (ou
+# l'interface Qt) n'est jamais forké, et chaque processus n'importe pandas qu'une fois.
+EXECUTEUR = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+
+
+def repartir(elements: List[str], nb_groupes: int) -> List[List[str]]:
+    """
+    Répartit une liste en `nb_groupes` groupes équilibrés (écart de taille d'au plus 1).
+
+    Args:
+        elements (List[str]): Les éléments à répartir (ordre conservé dans chaque groupe).
+        nb_groupes (int): Le nombre de groupes.
+
+    Returns:
+        List[List[str]]: Les groupes, les plus grands en premier.
+    """
+    taille, reste = divmod(len(elements), nb_groupes)
+    groupes = []
+    debut = 0
+    for i in range(nb_groupes):
+        fin = debut + taille + (1 if i < reste else 0)
+        groupes.append(elements[debut:fin])
+        debut = fin
+    return groupes
+
+
+def generer_planning_poules(
+    noms_ateliers: List[str],
+    noms_equipes: List[str],
+    nb_poules: int
+) -> pd.DataFrame:
+    """
+    Génère un planning en phase de poules, sous la même forme que `generer_planning`.
+
+    Les équipes sont réparties en `nb_poules` poules équilibrées (distribution en
+    alternance : la 1re équipe dans la poule 1, la 2e dans la poule 2, etc.) et les
+    ateliers sont partagés en blocs disjoints, un par poule. Le planning de chaque
+    poule est généré dans un processus partagé (`EXECUTEUR`), puis les tours sont
+    fusionnés : le tour N global regroupe le tour N de chaque poule. Les blocs d'ateliers étant
+    disjoints, aucun atelier ne peut être réservé deux fois sur un même tour.
+
+    Args:
+        noms_ateliers (List[str]): La liste des noms des ateliers.
+        noms_equipes (List[str]): La liste des noms des équipes.
+        nb_poules (int): Le nombre de poules.
+
+    Returns:
+        pd.DataFrame: Le planning global (colonnes 'Tour', ateliers, 'Equipes en pause').
+
+    Raises:
+        ValueError: Si le nombre de poules est invalide pour les équipes et ateliers fournis.
+    """
+    if nb_poules < 1:
+        raise ValueError("Le nombre de poules doit être au moins 1.")
+    if nb_poules > len(noms_ateliers):
+        raise ValueError("Il faut au moins un atelier par poule.")
+    if nb_poules > len(noms_equipes):
+        raise ValueError("Il faut au moins une équipe par poule.")
+
+    # 1. Répartition des équipes (alternance) et des ateliers (blocs contigus)
+    poules_equipes = [noms_equipes[i::nb_poules] for i in range(nb_poules)]
+    poules_ateliers = repartir(noms_ateliers, nb_poules)
+
+    # 2. Génération parallèle des tours de chaque poule (pauses renvoyées en listes)
+    if nb_poules == 1:
+        tours_poules = [generer_tours(poules_ateliers[0], poules_equipes[0])]
+    else:
+        tours_poules = list(EXECUTEUR.map(generer_tours, poules_ateliers, poules_equipes))
+
+    # 3. Fusion des tours
+    nb_tours = max(len(tours) for tours in tours_poules)
+
+    planning_global = []
+    for tour in range(nb_tours):
+        tour_data: Dict[str, Any] = {"Tour": tour + 1}
+        equipes_en_pause: List[str] = []
+
+        for tours, ateliers, equipes in zip(tours_poules, poules_ateliers, poules_equipes):
+            if tour < len(tours):
+                ligne = tours[tour]
+                for atelier in ateliers:
+                    tour_data[atelier] = ligne[atelier]
+                equipes_en_pause.extend(ligne["Equipes en pause"])
+            else:
+                # Poule déjà terminée : ateliers libres, toutes ses équipes en pause
+                for atelier in ateliers:
+                    tour_data[atelier] = "-"
+                equipes_en_pause.extend(equipes)
+
+        tour_data["Equipes en pause"] = ", ".join(sorted(equipes_en_pause))
+        planning_global.append(tour_data)
+
+    colonnes_ordonnees = ["Tour"] + noms_ateliers + ["Equipes en pause"]
+    return pd.DataFrame(planning_global).reindex(columns=colonnes_ordonnees)
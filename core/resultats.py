@@ -0,0 +1,258 @@
+import json
+import threading
+from typing import List, Dict, Any, Set, Tuple
+
+import pandas as pd
+
+
+# Barème des points (classique : victoire 3, nul 1, défaite 0)
+POINTS_VICTOIRE = 3
+POINTS_NUL = 1
+POINTS_DEFAITE = 0
+
+COLONNES_HORS_ATELIERS = ["Tour", "Equipes en pause"]
+
+
+def _points(score_pour: int, score_contre: int) -> int:
+    """ Retourne les points obtenus pour un score donné. """
+    if score_pour > score_contre:
+        return POINTS_VICTOIRE
+    if score_pour == score_contre:
+        return POINTS_NUL
+    return POINTS_DEFAITE
+
+
+def valider_entier(valeur: Any, nom: str) -> int:
+    """
+    Valide un entier issu d'une requête (refuse les décimaux, booléens et textes non numériques).
+
+    Raises:
+        ValueError: Si la valeur n'est pas un entier.
+    """
+    if isinstance(valeur, bool):
+        raise ValueError(f"{nom} doit être un entier.")
+    if isinstance(valeur, int):
+        return valeur
+    if isinstance(valeur, str) and valeur.strip().lstrip("-").isdigit():
+        return int(valeur)
+    raise ValueError(f"{nom} doit être un entier.")
+
+
+class TableauResultats:
+    """
+    Saisie des scores et classement maintenu de façon incrémentale.
+
+    Les matchs sont identifiés par leur cellule (tour, atelier) dans le planning
+    issu de `generer_planning`. Les équipes sont celles fournies par l'appelant :
+    la colonne 'Equipes en pause' (texte joint par ", ") n'est jamais relue, un nom
+    d'équipe pouvant contenir une virgule. Une saisie met à jour en O(1) les statistiques des
+    deux équipes et les déplace entre les groupes d'équipes à égalité de points ;
+    les groupes touchés sont marqués à retrier.
+
+    Le départage (confrontations directes, différence de buts, buts marqués) n'est
+    calculé qu'à la lecture du classement, et uniquement pour les groupes modifiés
+    depuis la lecture précédente. Le classement et sa version JSON sont mis en
+    cache par version : entre deux saisies, les lectures ne coûtent rien.
+    """
+    def __init__(self, planning: pd.DataFrame, noms_equipes: List[str]):
+        """
+        Args:
+            planning (pd.DataFrame): Le planning du tournoi (sortie de `generer_planning`).
+            noms_equipes (List[str]): Les équipes du tournoi, y compris celles toujours en pause.
+        """
+        # Index des matchs : { (tour, atelier): (equipe_a, equipe_b) }
+        self.matchs: Dict[Tuple[int, str], Tuple[str, str]] = {}
+        equipes = set(noms_equipes)
+
+        ateliers = [c for c in planning.columns if c not in COLONNES_HORS_ATELIERS]
+        for tour, ligne in zip(planning["Tour"], planning[ateliers].itertuples(index=False)):
+            for atelier, cellule in zip(ateliers, ligne):
+                if not isinstance(cellule, str) or " vs " not in cellule:
+                    continue
+                parts = cellule.split(" vs ")
+                if len(parts) != 2:
+                    continue
+                eq_a, eq_b = parts[0].strip(), parts[1].strip()
+                self.matchs[(int(tour), atelier)] = (eq_a, eq_b)
+                equipes.add(eq_a)
+                equipes.add(eq_b)
+
+        # Statistiques par équipe
+        self.stats: Dict[str, Dict[str, int]] = {
+            eq: {"Points": 0, "Joués": 0, "Victoires": 0, "Nuls": 0, "Défaites": 0,
+                 "Buts pour": 0, "Buts contre": 0}
+            for eq in equipes
+        }
+
+        # Points obtenus en confrontation directe : { equipe: { adversaire: points } }
+        self.confrontations: Dict[str, Dict[str, int]] = {eq: {} for eq in equipes}
+
+        # Scores saisis : { (tour, atelier): (score_a, score_b) }
+        self.scores: Dict[Tuple[int, str], Tuple[int, int]] = {}
+
+        # Groupes d'équipes à égalité de points, et ordre de départage de chaque groupe
+        self._groupes: Dict[int, Set[str]] = {0: set(equipes)} if equipes else {}
+        self._ordre_groupes: Dict[int, List[str]] = {}
+        self._groupes_modifies: Set[int] = set(self._groupes)
+
+        self.version = 0
+        self._cache_version = -1
+        self._cache_classement: List[Dict[str, Any]] = []
+        self._cache_json_version = -1
+        self._cache_json = b"[]"
+        self._verrou = threading.RLock()
+
+    def _deplacer(self, equipe: str, anciens_points: int) -> None:
+        """ Change une équipe de groupe si ses points ont changé et marque les groupes touchés. """
+        points = self.stats[equipe]["Points"]
+        self._groupes_modifies.add(points)
+        if points == anciens_points:
+            return
+
+        groupe = self._groupes[anciens_points]
+        groupe.discard(equipe)
+        if groupe:
+            self._groupes_modifies.add(anciens_points)
+        else:
+            del self._groupes[anciens_points]
+            self._ordre_groupes.pop(anciens_points, None)
+            self._groupes_modifies.discard(anciens_points)
+        self._groupes.setdefault(points, set()).add(equipe)
+
+    def _appliquer(self, equipe: str, adversaire: str, pour: int, contre: int, sens: int) -> None:
+        """ Ajoute (sens=1) ou retire (sens=-1) la contribution d'un match aux statistiques. """
+        s = self.stats[equipe]
+        pts = _points(pour, contre)
+        s["Points"] += sens * pts
+        s["Joués"] += sens
+        s["Buts pour"] += sens * pour
+        s["Buts contre"] += sens * contre
+        if pour > contre:
+            s["Victoires"] += sens
+        elif pour == contre:
+            s["Nuls"] += sens
+        else:
+            s["Défaites"] += sens
+
+        directs = self.confrontations[equipe]
+        directs[adversaire] = directs.get(adversaire, 0) + sens * pts
+
+    def enregistrer_score(self, tour: int, atelier: str, score_a: int, score_b: int) -> Dict[str, Any]:
+        """
+        Enregistre (ou corrige) le score du match joué au tour et à l'atelier donnés.
+
+        Args:
+            tour (int): Le numéro du tour (tel qu'affiché dans la colonne 'Tour').
+            atelier (str): Le nom de l'atelier.
+            score_a (int): Le score de l'équipe citée en premier dans la cellule.
+            score_b (int): Le score de l'équipe citée en second.
+
+        Returns:
+            Dict[str, Any]: Le match mis à jour (tour, atelier, équipes, scores).
+
+        Raises:
+            KeyError: Si aucun match n'est prévu pour ce tour et cet atelier.
+            ValueError: Si le tour ou un score n'est pas un entier, ou si un score est négatif.
+        """
+        cle_match = (valider_entier(tour, "Le tour"), atelier)
+        score_a = valider_entier(score_a, "Le score")
+        score_b = valider_entier(score_b, "Le score")
+        if cle_match not in self.matchs:
+            raise KeyError(f"Aucun match au tour {tour} sur l'atelier '{atelier}'.")
+        if score_a < 0 or score_b < 0:
+            raise ValueError("Les scores ne peuvent pas être négatifs.")
+
+        eq_a, eq_b = self.matchs[cle_match]
+
+        with self._verrou:
+            anciens_points = {eq: self.stats[eq]["Points"] for eq in (eq_a, eq_b)}
+
+            # Correction : on annule d'abord l'ancien score éventuel
+            ancien = self.scores.get(cle_match)
+            if ancien is not None:
+                self._appliquer(eq_a, eq_b, ancien[0], ancien[1], -1)
+                self._appliquer(eq_b, eq_a, ancien[1], ancien[0], -1)
+
+            self._appliquer(eq_a, eq_b, score_a, score_b, 1)
+            self._appliquer(eq_b, eq_a, score_b, score_a, 1)
+            self.scores[cle_match] = (score_a, score_b)
+
+            for eq in (eq_a, eq_b):
+                self._deplacer(eq, anciens_points[eq])
+
+            self.version += 1
+
+        return {
+            "Tour": cle_match[0],
+            "Atelier": atelier,
+            "Equipe A": eq_a,
+            "Equipe B": eq_b,
+            "Score A": score_a,
+            "Score B": score_b,
+        }
+
+    def statistiques(self, equipe: str) -> Dict[str, Any]:
+        """ Ligne de statistiques d'une équipe (sans le rang, qui dépend de toutes les autres). """
+        s = self.stats[equipe]
+        return {
+            "Equipe": equipe,
+            "Points": s["Points"],
+            "Joués": s["Joués"],
+            "Victoires": s["Victoires"],
+            "Nuls": s["Nuls"],
+            "Défaites": s["Défaites"],
+            "Buts pour": s["Buts pour"],
+            "Buts contre": s["Buts contre"],
+            "Différence": s["Buts pour"] - s["Buts contre"],
+        }
+
+    def _departager(self, groupe: Set[str]) -> List[str]:
+        """
+        Ordonne des équipes à égalité de points : confrontations directes, différence
+        de buts, buts marqués, nom. Le coût est proportionnel au nombre d'adversaires
+        déjà rencontrés par les équipes du groupe.
+        """
+        def cle(eq: str) -> Tuple[int, int, int, str]:
+            directs = sum(pts for adv, pts in self.confrontations[eq].items() if adv in groupe)
+            s = self.stats[eq]
+            return (-directs, -(s["Buts pour"] - s["Buts contre"]), -s["Buts pour"], eq)
+
+        return sorted(groupe, key=cle)
+
+    def classement(self) -> List[Dict[str, Any]]:
+        """
+        Retourne le classement courant.
+
+        Ordre : points, confrontations directes, différence de buts, buts marqués, nom.
+        Seuls les groupes d'égalité modifiés depuis la dernière lecture sont retriés ;
+        le résultat est mis en cache jusqu'à la prochaine saisie de score.
+
+        Returns:
+            List[Dict[str, Any]]: Une ligne par équipe (Rang, Equipe, Points, ...).
+        """
+        with self._verrou:
+            if self._cache_version == self.version:
+                return self._cache_classement
+
+            for points in self._groupes_modifies:
+                if points in self._groupes:
+                    self._ordre_groupes[points] = self._departager(self._groupes[points])
+            self._groupes_modifies.clear()
+
+            lignes = []
+            for points in sorted(self._ordre_groupes, reverse=True):
+                for eq in self._ordre_groupes[points]:
+                    lignes.append({"Rang": len(lignes) + 1, **self.statistiques(eq)})
+
+            self._cache_classement = lignes
+            self._cache_version = self.version
+            return lignes
+
+    def classement_json(self) -> bytes:
+        """ Classement courant sérialisé en JSON (UTF-8), mis en cache par version. """
+        with self._verrou:
+            lignes = self.classement()
+            if self._cache_json_version != self._cache_version:
+                self._cache_json = json.dumps(lignes, ensure_ascii=False).encode("utf-8")
+                self._cache_json_version = self._cache_version
+            return self._cache_json
@@ -2,13 +2,16 @@ import sys
 from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
-                             QFileDialog, QMessageBox, QHeaderView)
+                             QFileDialog, QMessageBox, QHeaderView, QSpinBox)
 
 
 import pandas as pd
 from typing import Optional
 
-from core.algo import generer_planning, conversions_par_equipe
+from core.algo import generer_planning
+from core.export import exporter_excel_equipes
+from core.importation import lire_noms
+from core.poules import generer_planning_poules
 from desktop.utils.constants import BACKGROUND_COLOR, FONT_FAMILY
 from desktop.ui.widgets import CardFrame, InputSection, MainButton
 
@@ -102,6 +105,23 @@ class TournamentApp(QMainWindow):
         )
         left_panel.addWidget(self.ateliers_card)
 
+        # Import de fichiers CSV/XLSX dans chaque carte
+        self.teams_card.btn_import.clicked.connect(lambda: self.importer_liste(self.teams_card))
+        self.ateliers_card.btn_import.clicked.connect(lambda: self.importer_liste(self.ateliers_card))
+
+        # Nombre de poules (1 = tournoi unique, sinon phase de poules)
+        poules_layout = QHBoxLayout()
+        poules_label = QLabel("Nombre de poules")
+        poules_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #333;")
+        self.spin_poules = QSpinBox()
+        self.spin_poules.setRange(1, 64)
+        self.spin_poules.setValue(1)
+        self.spin_poules.setFixedWidth(70)
+        poules_layout.addWidget(poules_label)
+        poules_layout.addStretch()
+        poules_layout.addWidget(self.spin_poules)
+        left_panel.addLayout(poules_layout)
+
         # Espaceur
         left_panel.addStretch()
 
@@ -193,15 +213,35 @@ class TournamentApp(QMainWindow):
             QMessageBox.warning(self, "Erreur", "Veuillez entrer au moins une équipe et un atelier.")
             return
 
-        # 2. Appel de l'algo
+        # 2. Appel de l'algo (en phase de poules si plusieurs poules sont demandées)
+        nb_poules = self.spin_poules.value()
         try:
-            self.df_resultat = generer_planning(ateliers, teams)
+            if nb_poules > 1:
+                self.df_resultat = generer_planning_poules(ateliers, teams, nb_poules)
+            else:
+                self.df_resultat = generer_planning(ateliers, teams)
             self.afficher_tableau()
             self.btn_export.setEnabled(True)
             self.btn_export_teams.setEnabled(True)
         except Exception as e:
             QMessageBox.critical(self, "Erreur", f"Une erreur est survenue : {str(e)}")
 
+    def importer_liste(self, section: InputSection):
+        """Importe une liste de noms (CSV ou Excel) dans la carte de saisie donnée."""
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Importer une liste", "", "Fichiers CSV ou Excel (*.csv *.txt *.xlsx)"
+        )
+
+        if filename:
+            try:
+                # Lecture ligne par ligne, noms normalisés et dédoublonnés
+                with open(filename, "rb") as f:
+                    noms = lire_noms(f, filename)
+                # Un seul remplissage de la zone de texte (bien plus rapide qu'un collage)
+                section.set_text("\n".join(noms))
+            except Exception as e:
+                QMessageBox.critical(self, "Erreur", f"Impossible d'importer le fichier : {str(e)}")
+
     def afficher_tableau(self):
         """Remplit le QTableWidget avec les données du DataFrame."""
         if self.df_resultat is None:
@@ -257,15 +297,8 @@ class TournamentApp(QMainWindow):
 
         if filename:
             try:
-                # 1. Conversion
-                plannings = conversions_par_equipe(self.df_resultat)
-
-                # 2. Ecriture Excel multi-feuilles
-                with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-                    for equipe, df_eq in plannings.items():
-                        # Nom de feuille propre (Excel limite à 31 chars)
-                        sheet_name = equipe[:30].replace(":", "").replace("/", "")
-                        df_eq.to_excel(writer, sheet_name=sheet_name, index=False)
+                # Ecriture Excel multi-feuilles en flux (équipes traitées par lots, lignes écrites au fil du parcours)
+                exporter_excel_equipes(self.df_resultat, filename)
 
                 QMessageBox.information(self, "Succès", "Fichier Excel généré avec succès !")
             except Exception as e:
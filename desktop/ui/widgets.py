@@ -71,9 +71,29 @@ class InputSection(CardFrame):
             "font-size: 16px; font-weight: bold; color: #333; background: transparent; border: none;"
             )
 
+        # Bouton d'import (fichier CSV/XLSX), connecté par la fenêtre principale
+        self.btn_import = QPushButton("Importer")
+        self.btn_import.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_import.setStyleSheet(f"""
+            QPushButton {{
+                background-color: rgba(255, 255, 255, 0.7);
+                border: none;
+                border-radius: 10px;
+                padding: 4px 12px;
+                font-family: {FONT_FAMILY};
+                font-size: 12px;
+                font-weight: bold;
+                color: #333;
+            }}
+            QPushButton:hover {{
+                background-color: rgba(255, 255, 255, 0.95);
+            }}
+        """)
+
         header_layout.addWidget(icon_label)
         header_layout.addWidget(title_label)
         header_layout.addStretch()
+        header_layout.addWidget(self.btn_import)
         layout.addLayout(header_layout)
 
         # Zone de saisie (Boîte blanche à l'intérieur de la carte dégradée)
@@ -102,6 +122,10 @@ class InputSection(CardFrame):
         """Récupère le texte brut de la zone de saisie."""
         return self.text_input.toPlainText()
 
+    def set_text(self, text: str) -> None:
+        """Remplace le contenu de la zone de saisie."""
+        self.text_input.setPlainText(text)
+
 
 class MainButton(QPushButton):
     """
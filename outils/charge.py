@@ -0,0 +1,309 @@
+"""
+Banc de charge local de l'API Flask (web/main.py).
+
+Démarre l'application dans un sous-processus, envoie un mélange configurable de
+requêtes (/api/generate, /api/export/csv, /api/export/xlsx) avec une concurrence
+cible, puis mesure le débit, les latences p50/p95/p99, le taux d'erreur et la
+mémoire résidente (RSS) du serveur. Les résultats sont enregistrés en JSON pour
+comparer la capacité d'une version à l'autre.
+
+Utilisation :
+    python -m outils.charge --concurrence 16 --duree 30 --tailles 20,100,500
+    python -m outils.charge --comparer ancien.json nouveau.json
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+RACINE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOSSIER_RESULTATS = os.path.join(RACINE, "outils", "resultats_charge")
+
+ENDPOINTS = {
+    "generate": "/api/generate",
+    "csv": "/api/export/csv",
+    "xlsx": "/api/export/xlsx",
+}
+
+# Lancement du serveur sans debug ni rechargement (un seul processus à mesurer)
+COMMANDE_SERVEUR = (
+    "import sys; sys.path.insert(0, {racine!r}); "
+    "from web.main import app; "
+    "app.run(host='127.0.0.1', port={port}, debug=False, threaded=True)"
+)
+
+
+def lire_rss(pid: int) -> Optional[float]:
+    """ Retourne la mémoire résidente du processus en Mo (None si indisponible). """
+    try:
+        import psutil
+        return round(psutil.Process(pid).memory_info().rss / (1024 * 1024), 1)
+    except ImportError:
+        pass
+    except Exception:
+        return None
+
+    # Repli Linux sans psutil
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for ligne in f:
+                if ligne.startswith("VmRSS:"):
+                    return round(int(ligne.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def percentile(valeurs_triees: List[float], p: float) -> float:
+    """ Percentile (méthode du rang le plus proche) d'une liste déjà triée. """
+    if not valeurs_triees:
+        return 0.0
+    rang = max(1, int(round(p / 100 * len(valeurs_triees))))
+    return valeurs_triees[min(rang, len(valeurs_triees)) - 1]
+
+
+def resumer(mesures: List[Tuple[float, bool]], duree: float) -> Dict[str, Any]:
+    """ Calcule débit, latences (ms) et taux d'erreur d'une série de mesures (latence, succès). """
+    latences = sorted(m[0] * 1000 for m in mesures)
+    nb_erreurs = sum(1 for m in mesures if not m[1])
+    return {
+        "requetes": len(mesures),
+        "erreurs": nb_erreurs,
+        "taux_erreur": nb_erreurs / len(mesures) if mesures else 0.0,
+        "debit_rps": len(mesures) / duree if duree > 0 else 0.0,
+        "latence_moyenne_ms": sum(latences) / len(latences) if latences else 0.0,
+        "p50_ms": percentile(latences, 50),
+        "p95_ms": percentile(latences, 95),
+        "p99_ms": percentile(latences, 99),
+    }
+
+
+def demarrer_serveur(port: int, delai: float = 20.0) -> subprocess.Popen:
+    """ Démarre l'application Flask localement et attend qu'elle réponde. """
+    processus = subprocess.Popen(
+        [sys.executable, "-c", COMMANDE_SERVEUR.format(racine=RACINE, port=port)],
+        cwd=RACINE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    limite = time.time() + delai
+    while time.time() < limite:
+        if processus.poll() is not None:
+            raise RuntimeError("Le serveur s'est arrêté au démarrage.")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1).read()
+            return processus
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.2)
+    processus.terminate()
+    raise RuntimeError("Le serveur n'a pas répondu à temps.")
+
+
+def construire_charge(taille: int) -> bytes:
+    """ Corps JSON d'un tournoi de `taille` équipes (un atelier pour deux équipes). """
+    return json.dumps({
+        "teams": [f"Equipe {i}" for i in range(1, taille + 1)],
+        "ateliers": [f"Atelier {i}" for i in range(1, max(1, taille // 2) + 1)],
+    }).encode("utf-8")
+
+
+def envoyer(url: str, corps: bytes, timeout: float) -> Tuple[float, bool]:
+    """ Envoie une requête POST et retourne (latence en s, succès). """
+    requete = urllib.request.Request(url, data=corps, headers={"Content-Type": "application/json"})
+    debut = time.perf_counter()
+    try:
+        with urllib.request.urlopen(requete, timeout=timeout) as reponse:
+            reponse.read()
+            succes = reponse.status == 200
+    except (urllib.error.URLError, http.client.HTTPException, OSError):
+        # HTTPException : réponse tronquée ou invalide (IncompleteRead, BadStatusLine...)
+        # typique d'un serveur saturé, comptée comme une requête en échec
+        succes = False
+    return time.perf_counter() - debut, succes
+
+
+def lancer_charge(
+    port: int,
+    melange: Dict[str, int],
+    tailles: List[int],
+    concurrence: int,
+    duree: float,
+    timeout: float,
+    graine: int,
+    pid_serveur: int
+) -> Dict[str, Any]:
+    """
+    Envoie des requêtes pendant `duree` secondes avec `concurrence` clients simultanés.
+
+    Returns:
+        Dict[str, Any]: Statistiques globales, par endpoint, par taille et mémoire du serveur.
+    """
+    corps_par_taille = {taille: construire_charge(taille) for taille in tailles}
+    choix_endpoints = [nom for nom, poids in melange.items() for _ in range(poids)]
+
+    mesures: List[Tuple[str, int, float, bool]] = []
+    verrou = threading.Lock()
+    rss: List[float] = []
+    fin = time.time() + duree
+    arret = threading.Event()
+
+    def echantillonner_rss():
+        while not arret.is_set():
+            valeur = lire_rss(pid_serveur)
+            if valeur is not None:
+                rss.append(valeur)
+            arret.wait(0.5)
+
+    def client(indice: int):
+        aleatoire = random.Random(graine + indice)
+        locales = []
+        while time.time() < fin:
+            nom = aleatoire.choice(choix_endpoints)
+            taille = aleatoire.choice(tailles)
+            url = f"http://127.0.0.1:{port}{ENDPOINTS[nom]}"
+            latence, succes = envoyer(url, corps_par_taille[taille], timeout)
+            locales.append((nom, taille, latence, succes))
+        with verrou:
+            mesures.extend(locales)
+
+    echantillonneur = threading.Thread(target=echantillonner_rss, daemon=True)
+    echantillonneur.start()
+    debut = time.time()
+    with ThreadPoolExecutor(max_workers=concurrence) as executor:
+        list(executor.map(client, range(concurrence)))
+    duree_reelle = time.time() - debut
+    arret.set()
+    echantillonneur.join()
+
+    return {
+        "global": resumer([(m[2], m[3]) for m in mesures], duree_reelle),
+        "par_endpoint": {
+            nom: resumer([(m[2], m[3]) for m in mesures if m[0] == nom], duree_reelle)
+            for nom in melange
+        },
+        "par_taille": {
+            str(taille): resumer([(m[2], m[3]) for m in mesures if m[1] == taille], duree_reelle)
+            for taille in tailles
+        },
+        "rss_max_mo": max(rss) if rss else None,
+        "rss_fin_mo": rss[-1] if rss else None,
+    }
+
+
+def version_courante() -> str:
+    """ Identifiant git de la version testée ('inconnue' hors dépôt git). """
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=RACINE, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "inconnue"
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    """ Affiche un rapport de charge sous forme de tableau. """
+    print(f"Version {rapport['version']} - {rapport['date']}")
+    print(f"{'':<14}{'req':>8}{'err %':>8}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    lignes = [("global", rapport["resultats"]["global"])]
+    lignes += list(rapport["resultats"]["par_endpoint"].items())
+    lignes += [(f"{t} équipes", r) for t, r in rapport["resultats"]["par_taille"].items()]
+    for nom, r in lignes:
+        print(f"{nom:<14}{r['requetes']:>8}{r['taux_erreur'] * 100:>8.1f}{r['debit_rps']:>9.1f}"
+              f"{r['p50_ms']:>9.1f}{r['p95_ms']:>9.1f}{r['p99_ms']:>9.1f}")
+    print(f"RSS serveur : max {rapport['resultats']['rss_max_mo']} Mo, fin {rapport['resultats']['rss_fin_mo']} Mo")
+
+
+def comparer(chemin_ancien: str, chemin_nouveau: str) -> None:
+    """ Compare deux rapports enregistrés (écarts relatifs sur les indicateurs globaux). """
+    with open(chemin_ancien, encoding="utf-8") as f:
+        ancien = json.load(f)
+    with open(chemin_nouveau, encoding="utf-8") as f:
+        nouveau = json.load(f)
+
+    print(f"{ancien['version']} -> {nouveau['version']}")
+    for cle in ["debit_rps", "p50_ms", "p95_ms", "p99_ms", "taux_erreur"]:
+        a = ancien["resultats"]["global"][cle]
+        n = nouveau["resultats"]["global"][cle]
+        ecart = f"{(n - a) / a * 100:+.1f} %" if a else "n/a"
+        print(f"{cle:<14}{a:>10.2f}{n:>10.2f}{ecart:>10}")
+    for cle in ["rss_max_mo", "rss_fin_mo"]:
+        print(f"{cle:<14}{str(ancien['resultats'][cle]):>10}{str(nouveau['resultats'][cle]):>10}")
+
+
+def lire_melange(texte: str) -> Dict[str, int]:
+    """ Lit un mélange 'generate:5,csv:2,xlsx:1' en dictionnaire de poids. """
+    melange = {}
+    for element in texte.split(","):
+        nom, _, poids = element.partition(":")
+        nom = nom.strip()
+        if nom not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"Endpoint inconnu : {nom}")
+        melange[nom] = int(poids) if poids else 1
+    return melange
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Banc de charge local de l'API Flask.")
+    parser.add_argument("--concurrence", type=int, default=8, help="Nombre de clients simultanés.")
+    parser.add_argument("--duree", type=float, default=20.0, help="Durée de la charge (secondes).")
+    parser.add_argument("--tailles", default="20,100", help="Nombres d'équipes, séparés par des virgules.")
+    parser.add_argument("--melange", type=lire_melange, default="generate:5,csv:2,xlsx:1",
+                        help="Poids des endpoints (ex: generate:5,csv:2,xlsx:1).")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=60.0, help="Délai maximal par requête (secondes).")
+    parser.add_argument("--graine", type=int, default=42, help="Graine du tirage des requêtes.")
+    parser.add_argument("--sortie", help="Fichier JSON de résultats (défaut : outils/resultats_charge/).")
+    parser.add_argument("--comparer", nargs=2, metavar=("ANCIEN", "NOUVEAU"),
+                        help="Compare deux rapports enregistrés au lieu de lancer une charge.")
+    args = parser.parse_args(arguments)
+
+    if args.comparer:
+        comparer(*args.comparer)
+        return
+
+    tailles = [int(t) for t in args.tailles.split(",") if t.strip()]
+    serveur = demarrer_serveur(args.port)
+    try:
+        resultats = lancer_charge(
+            args.port, args.melange, tailles, args.concurrence,
+            args.duree, args.timeout, args.graine, serveur.pid
+        )
+    finally:
+        serveur.terminate()
+        serveur.wait()
+
+    rapport = {
+        "version": version_courante(),
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "configuration": {
+            "concurrence": args.concurrence,
+            "duree": args.duree,
+            "tailles": tailles,
+            "melange": args.melange,
+        },
+        "resultats": resultats,
+    }
+    afficher(rapport)
+
+    sortie = args.sortie
+    if not sortie:
+        os.makedirs(DOSSIER_RESULTATS, exist_ok=True)
+        horodatage = datetime.now().strftime("%Y%m%d-%H%M%S")
+        sortie = os.path.join(DOSSIER_RESULTATS, f"charge_{rapport['version']}_{horodatage}.json")
+    with open(sortie, "w", encoding="utf-8") as f:
+        json.dump(rapport, f, ensure_ascii=False, indent=2)
+    print(f"Résultats enregistrés : {sortie}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Contrôle de non-régression mémoire de l'export Excel par équipe.
+
+Mesure avec tracemalloc le pic d'allocation de `exporter_excel_equipes` pour des
+tournois de taille croissante. Le planning est généré avant la mesure et le
+fichier produit est déversé sur disque dès 64 Ko : seule la mémoire de travail
+de l'export est comptabilisée (côté Web, il faut y ajouter au plus
+SEUIL_FICHIER_TEMPORAIRE pour le fichier de sortie gardé en mémoire).
+
+Deux critères sont vérifiés (BudgetMemoireDepasse levée sinon) :
+- le pic reste sous un budget fixe (Mo) pour toutes les tailles ;
+- la pente du pic entre la plus petite et la plus grande taille reste sous un coût
+  par équipe (Ko) : seuls le nom de feuille et l'entrée d'archive de chaque équipe
+  (moins de 1 Ko) sont conservés jusqu'à la fin de l'écriture.
+
+Utilisation :
+    python -m outils.memoire --tailles 50,200,400,800 --budget 4 --pente 2
+"""
+import argparse
+import sys
+import tracemalloc
+from typing import List, Dict, Optional
+
+from core.algo import generer_planning
+from core.export import exporter_excel_equipes, fichier_temporaire
+
+# Budget (Mo) du pic d'allocation d'un export, quelle que soit la taille du tournoi
+BUDGET_DEFAUT_MO = 4.0
+
+# Coût marginal maximal (Ko) d'une équipe supplémentaire sur le pic d'allocation
+PENTE_DEFAUT_KO = 2.0
+
+# Seuil du fichier de sortie pendant la mesure (déversé sur disque au-delà)
+SEUIL_MESURE = 64 * 1024
+
+
+class BudgetMemoireDepasse(Exception):
+    """ Pic d'allocation ou coût par équipe de l'export au-delà du budget fixé. """
+    def __init__(self, message: str, pics: Dict[int, float]):
+        super().__init__(message)
+        self.pics = pics
+
+
+def mesurer_export(nb_equipes: int, seuil_fichier: int = SEUIL_MESURE) -> float:
+    """
+    Retourne le pic d'allocation (Mo) de l'export Excel d'un tournoi de `nb_equipes` équipes.
+    """
+    planning = generer_planning(
+        [f"Atelier {i}" for i in range(1, max(1, nb_equipes // 2) + 1)],
+        [f"Equipe {i}" for i in range(1, nb_equipes + 1)]
+    )
+    sortie = fichier_temporaire(seuil_fichier)
+
+    tracemalloc.start()
+    try:
+        exporter_excel_equipes(planning, sortie)
+        _, pic = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        sortie.close()
+    return pic / (1024 * 1024)
+
+
+def pente_par_equipe(pics: Dict[int, float]) -> Optional[float]:
+    """
+    Coût marginal (Ko par équipe) entre la plus petite et la plus grande taille mesurée,
+    ou None si une seule taille a été mesurée.
+    """
+    petite, grande = min(pics), max(pics)
+    if grande == petite:
+        return None
+    return (pics[grande] - pics[petite]) * 1024 / (grande - petite)
+
+
+def verifier_budget(
+    tailles: List[int],
+    budget_mo: float = BUDGET_DEFAUT_MO,
+    pente_ko: float = PENTE_DEFAUT_KO
+) -> Dict[int, float]:
+    """
+    Mesure le pic d'allocation de l'export pour chaque taille.
+
+    Args:
+        tailles (List[int]): Les nombres d'équipes à mesurer.
+        budget_mo (float): Le pic maximal admis (Mo), pour toutes les tailles.
+        pente_ko (float): Le coût maximal (Ko) d'une équipe supplémentaire.
+
+    Returns:
+        Dict[int, float]: Le pic (Mo) de chaque taille.
+
+    Raises:
+        BudgetMemoireDepasse: Si un pic dépasse le budget ou si la pente dépasse `pente_ko`.
+    """
+    pics = {taille: mesurer_export(taille) for taille in tailles}
+
+    depassements = {t: round(p, 2) for t, p in pics.items() if p > budget_mo}
+    if depassements:
+        raise BudgetMemoireDepasse(f"Budget mémoire de {budget_mo} Mo dépassé : {depassements}", pics)
+
+    pente = pente_par_equipe(pics)
+    if pente is not None and pente > pente_ko:
+        raise BudgetMemoireDepasse(f"Coût par équipe de {pente:.2f} Ko (maximum {pente_ko} Ko).", pics)
+    return pics
+
+
+def afficher(pics: Dict[int, float]) -> None:
+    """ Affiche le pic de chaque taille et la pente mesurée. """
+    for taille, pic in sorted(pics.items()):
+        print(f"{taille:>6} équipes : pic {pic:8.2f} Mo")
+    pente = pente_par_equipe(pics)
+    if pente is not None:
+        print(f"Pente : {pente:.2f} Ko par équipe")
+
+
+def main(arguments: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Contrôle du pic mémoire de l'export Excel.")
+    parser.add_argument("--tailles", default="50,200,400,800", help="Nombres d'équipes, séparés par des virgules.")
+    parser.add_argument("--budget", type=float, default=BUDGET_DEFAUT_MO, help="Budget du pic d'allocation (Mo).")
+    parser.add_argument("--pente", type=float, default=PENTE_DEFAUT_KO, help="Coût maximal par équipe (Ko).")
+    args = parser.parse_args(arguments)
+
+    tailles = [int(t) for t in args.tailles.split(",") if t.strip()]
+    try:
+        pics = verifier_budget(tailles, args.budget, args.pente)
+    except BudgetMemoireDepasse as e:
+        afficher(e.pics)
+        print(e)
+        sys.exit(1)
+    afficher(pics)
+    print(f"Budget de {args.budget} Mo et pente de {args.pente} Ko par équipe respectés.")
+
+
+if __name__ == "__main__":
+    main()
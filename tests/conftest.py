@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Ajout du dossier racine au PYTHONPATH pour permettre l'import de 'core' et 'outils'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
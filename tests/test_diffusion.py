@@ -0,0 +1,40 @@
+from core.diffusion import Diffuseur, EVENEMENT_RESYNC
+
+
+def _messages(abonnement):
+    messages = []
+    while not abonnement.file.empty():
+        messages.append(abonnement.file.get_nowait())
+    return messages
+
+
+def test_nouvel_abonne_recoit_resync_puis_les_evenements():
+    diffuseur = Diffuseur()
+    diffuseur.publier("tour", {"Tour": 1})
+    abonnement = diffuseur.abonner()
+    diffuseur.publier("tour", {"Tour": 2})
+
+    messages = _messages(abonnement)
+    assert messages[0] == EVENEMENT_RESYNC
+    assert messages[1].startswith(b"id: 2\nevent: tour\n")
+
+
+def test_reconnexion_sans_evenement_manque_pas_de_resync():
+    diffuseur = Diffuseur()
+    dernier = diffuseur.publier("tour", {"Tour": 1})
+
+    assert _messages(diffuseur.abonner(dernier)) == []
+    # Événements manqués, ou identifiant d'avant un redémarrage du serveur
+    assert _messages(diffuseur.abonner(dernier - 1)) == [EVENEMENT_RESYNC]
+    assert _messages(diffuseur.abonner(dernier + 10)) == [EVENEMENT_RESYNC]
+
+
+def test_tampon_plein_remplace_par_resync():
+    diffuseur = Diffuseur(taille_tampon=3)
+    abonnement = diffuseur.abonner(0)
+    for tour in range(5):
+        diffuseur.publier("tour", {"Tour": tour})
+
+    messages = _messages(abonnement)
+    assert EVENEMENT_RESYNC in messages
+    assert len(messages) <= 3
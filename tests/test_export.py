@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from core.algo import generer_planning, conversions_par_equipe
+from core.export import exporter_excel_equipes, fichier_temporaire
+from outils.memoire import verifier_budget, BudgetMemoireDepasse, PENTE_DEFAUT_KO
+
+
+def _planning(nb_equipes: int, nb_ateliers: int) -> pd.DataFrame:
+    return generer_planning(
+        [f"Atelier {i}" for i in range(1, nb_ateliers + 1)],
+        [f"Equipe {i}" for i in range(1, nb_equipes + 1)]
+    )
+
+
+def test_export_identique_aux_conversions_par_equipe():
+    """ Le classeur contient les mêmes feuilles, dans le même ordre, que conversions_par_equipe. """
+    planning = _planning(13, 5)
+    sortie = fichier_temporaire()
+    # Lots de 4 feuilles : plusieurs relectures du planning
+    exporter_excel_equipes(planning, sortie, nb_feuilles_ouvertes=4)
+    sortie.seek(0)
+
+    feuilles = pd.read_excel(sortie, sheet_name=None)
+    attendu = conversions_par_equipe(planning)
+
+    assert list(feuilles) == list(attendu)
+    for equipe, df_eq in attendu.items():
+        pd.testing.assert_frame_equal(
+            feuilles[equipe].reset_index(drop=True), df_eq.reset_index(drop=True), check_dtype=False
+        )
+
+
+def test_export_noms_de_feuilles_valides_et_uniques():
+    """ Les caractères interdits sont retirés et les noms tronqués restent uniques. """
+    planning = generer_planning(["X"], ["a" * 40 + "1", "a" * 40 + "2", "b:/c"])
+    sortie = fichier_temporaire()
+    exporter_excel_equipes(planning, sortie)
+    sortie.seek(0)
+
+    noms = load_workbook(sortie).sheetnames
+    assert len(noms) == len(set(noms)) == 3
+    assert "bc" in noms
+    assert all(len(nom) <= 30 for nom in noms)
+
+
+def test_export_sans_match_produit_un_classeur_valide():
+    planning = _planning(1, 1)
+    sortie = fichier_temporaire()
+    exporter_excel_equipes(planning, sortie)
+    sortie.seek(0)
+
+    assert load_workbook(sortie).sheetnames == ["Planning"]
+
+
+def test_export_memoire_bornee():
+    """ Pic d'allocation sous un budget fixe et coût marginal par équipe limité. """
+    pics = verifier_budget([50, 200, 400])
+    assert set(pics) == {50, 200, 400}
+
+
+def test_budget_depasse_leve_une_exception():
+    """ Exception explicite (et non assert, retiré par python -O) avec les mesures jointes. """
+    with pytest.raises(BudgetMemoireDepasse) as erreur:
+        verifier_budget([20], budget_mo=0.001, pente_ko=PENTE_DEFAUT_KO)
+    assert set(erreur.value.pics) == {20}
@@ -0,0 +1,63 @@
+import io
+
+import pytest
+from openpyxl import Workbook
+
+from core.importation import lire_noms
+
+
+def _lire(contenu: str, nom_fichier: str):
+    return lire_noms(io.BytesIO(contenu.encode("utf-8")), nom_fichier)
+
+
+def test_txt_un_nom_par_ligne():
+    assert _lire("Durand, Martin\nDupont; Jean\n", "equipes.txt") == ["Durand, Martin", "Dupont; Jean"]
+
+
+def test_csv_une_colonne_sans_decoupage():
+    assert _lire("Durand, Martin\nDupont, Jean\n", "equipes.csv") == ["Durand, Martin", "Dupont, Jean"]
+    assert _lire('Equipes\n"Durand, Martin"\n"Les ""Bleus"""\n', "equipes.csv") == ["Durand, Martin", 'Les "Bleus"']
+
+
+def test_csv_plusieurs_colonnes_premiere_retenue():
+    assert _lire("Nom;Ville\nDurand, Martin;Lyon\nDupont;Paris\n", "equipes.csv") == ["Durand, Martin", "Dupont"]
+    assert _lire("Nom,Ville\nAlpha,Lyon\nBeta,Paris\n", "equipes.csv") == ["Alpha", "Beta"]
+
+
+def test_csv_ligne_incomplete_garde_le_decoupage():
+    """ Le nombre de colonnes le plus fréquent décide : une valeur manquante ne suffit pas. """
+    assert _lire("Nom,Ville\nAlpha,Lyon\nBeta\n", "equipes.csv") == ["Alpha", "Beta"]
+    assert _lire("Nom;Ville;Pays\nAlpha;Lyon;FR\nBeta;Paris\nGamma;Nice;FR\n", "equipes.csv") == ["Alpha", "Beta", "Gamma"]
+
+
+def test_csv_excel_francais_cp1252():
+    contenu = "Équipes;Ville\nÉlan;Lyon\nGaïa;Nîmes\n".encode("cp1252")
+    assert lire_noms(io.BytesIO(contenu), "equipes.csv") == ["Élan", "Gaïa"]
+
+
+def test_cp1252_apres_l_echantillon():
+    """ Un octet non UTF-8 au-delà de l'échantillon de détection : relecture en Windows-1252. """
+    contenu = ("".join(f"Equipe {i}\n" for i in range(1000)) + "Élan\n").encode("cp1252")
+    noms = lire_noms(io.BytesIO(contenu), "equipes.txt")
+    assert len(noms) == 1001 and noms[-1] == "Élan"
+
+
+def test_encodage_non_reconnu_refuse():
+    with pytest.raises(ValueError, match="Encodage"):
+        lire_noms(io.BytesIO(b"Alpha\n\x81\x8d\n"), "equipes.csv")
+
+
+def test_normalisation_et_doublons():
+    assert _lire("﻿  Alpha   1 \n\nalpha 1\nBeta\n", "equipes.csv") == ["Alpha 1", "Beta"]
+
+
+def test_xlsx_premiere_colonne():
+    classeur = Workbook()
+    feuille = classeur.active
+    for ligne in (["Ateliers", "Salle"], ["Tir", "A"], [None, "B"], ["Course", "C"]):
+        feuille.append(ligne)
+    flux = io.BytesIO()
+    classeur.save(flux)
+    flux.seek(0)
+
+    assert lire_noms(flux, "ateliers.xlsx") == ["Tir", "Course"]
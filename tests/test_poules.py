@@ -0,0 +1,63 @@
+import pytest
+
+from core.algo import generer_tours
+from core.poules import generer_planning_poules, repartir
+
+
+def _equipes_du_tour(ligne, ateliers):
+    """ Équipes qui jouent (par atelier) et équipes en pause sur une ligne du planning. """
+    joueurs = {}
+    for atelier in ateliers:
+        cellule = ligne[atelier]
+        if isinstance(cellule, str) and " vs " in cellule:
+            for equipe in cellule.split(" vs "):
+                joueurs.setdefault(equipe, []).append(atelier)
+    pauses = [p for p in ligne["Equipes en pause"].split(", ") if p]
+    return joueurs, pauses
+
+
+@pytest.mark.parametrize("nb_equipes, nb_ateliers, nb_poules", [(10, 4, 2), (11, 5, 3), (4, 3, 2), (9, 7, 4)])
+def test_fusion_une_place_par_equipe_et_ateliers_disjoints(nb_equipes, nb_ateliers, nb_poules):
+    equipes = [f"Equipe {i}" for i in range(1, nb_equipes + 1)]
+    ateliers = [f"Atelier {i}" for i in range(1, nb_ateliers + 1)]
+    planning = generer_planning_poules(ateliers, equipes, nb_poules)
+
+    poules_equipes = [set(equipes[i::nb_poules]) for i in range(nb_poules)]
+    poules_ateliers = repartir(ateliers, nb_poules)
+
+    assert list(planning.columns) == ["Tour"] + ateliers + ["Equipes en pause"]
+    for ligne in planning.to_dict(orient="records"):
+        joueurs, pauses = _equipes_du_tour(ligne, ateliers)
+
+        # Chaque équipe joue au plus un match par tour, ou est en pause
+        assert all(len(postes) == 1 for postes in joueurs.values())
+        assert sorted(list(joueurs) + pauses) == sorted(equipes)
+
+        # Un atelier n'accueille que des équipes de la poule qui le possède
+        for equipes_poule, ateliers_poule in zip(poules_equipes, poules_ateliers):
+            for equipe, (atelier,) in joueurs.items():
+                if atelier in ateliers_poule:
+                    assert equipe in equipes_poule
+
+
+def test_poule_terminee_mise_en_pause():
+    """ 4 équipes, 3 ateliers, 2 poules : la poule 2 (1 atelier) finit un tour avant la poule 1. """
+    equipes = ["A", "B", "C", "D"]
+    ateliers = ["X1", "X2", "Y"]
+    planning = generer_planning_poules(ateliers, equipes, 2)
+
+    assert len(generer_tours(["X1", "X2"], ["A", "C"])) == 2
+    assert len(generer_tours(["Y"], ["B", "D"])) == 1
+    assert len(planning) == 2
+
+    dernier = planning.iloc[-1]
+    assert dernier["Y"] == "-"
+    assert dernier["Equipes en pause"] == "B, D"
+
+
+def test_nombre_de_poules_invalide():
+    for nb_poules, nb_ateliers, nb_equipes in [(0, 2, 4), (3, 2, 4), (3, 4, 2)]:
+        with pytest.raises(ValueError):
+            generer_planning_poules(
+                [f"A{i}" for i in range(nb_ateliers)], [f"E{i}" for i in range(nb_equipes)], nb_poules
+            )
@@ -1,9 +1,15 @@
 import sys
 import os
-import io
-import pandas as pd
-from flask import Flask, request, jsonify, send_file
-from core.algo import generer_planning, conversions_par_equipe
+import json
+import threading
+from flask import Flask, Response, request, jsonify, send_file, stream_with_context
+from werkzeug.exceptions import HTTPException
+from core.algo import generer_planning
+from core.diffusion import Diffuseur
+from core.export import exporter_excel_equipes, fichier_temporaire
+from core.importation import lire_noms
+from core.poules import generer_planning_poules
+from core.resultats import TableauResultats, valider_entier
 
 # Ajout du dossier racine au PYTHONPATH pour permettre l'import de 'core'
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -14,6 +20,37 @@ app = Flask(__name__, static_folder='static', static_url_path='/static')
 app.config['JSON_SORT_KEYS'] = False
 app.json.sort_keys = False
 
+# Taille maximale d'une requête (JSON ou fichiers importés) : au-delà, Flask répond 413
+app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
+
+# Tournoi en cours (planning + résultats), partagé entre les requêtes.
+# 'planning_json' : planning sérialisé une seule fois par version, resservi par /api/planning
+tournoi_courant = {"planning": None, "planning_json": None, "resultats": None, "tour": None, "version_planning": 0}
+verrou_tournoi = threading.Lock()
+
+# Diffusion des mises à jour (tours, plannings, résultats) aux écrans abonnés
+diffuseur = Diffuseur()
+
+
+@app.errorhandler(413)
+def requete_trop_grande(e):
+    """ Réponse JSON lorsque la requête dépasse MAX_CONTENT_LENGTH. """
+    return jsonify({"detail": "Requête trop volumineuse."}), 413
+
+
+def generer(ateliers, teams, poules=1):
+    """
+    Génère le planning, en phase de poules si 'poules' (paramètre optionnel des requêtes) dépasse 1.
+    Lève une ValueError si le nombre de poules est invalide.
+    """
+    nb_poules = valider_entier(poules, "Le nombre de poules")
+    if nb_poules < 1:
+        raise ValueError("Le nombre de poules doit être un entier positif.")
+
+    if nb_poules > 1:
+        return generer_planning_poules(ateliers, teams, nb_poules)
+    return generer_planning(ateliers, teams)
+
 
 @app.route("/")
 def read_index():
@@ -25,7 +62,7 @@ def read_index():
 def generate_planning_route():
     """
     Génère le planning et le retourne au format JSON.
-    Attends un JSON avec 'teams' et 'ateliers'.
+    Attends un JSON avec 'teams' et 'ateliers' (et optionnellement 'poules').
     """
     data = request.get_json()
     if not data:
@@ -38,10 +75,12 @@ def generate_planning_route():
         return jsonify({"detail": "Les listes d'équipes et d'ateliers ne peuvent pas être vides."}), 400
 
     try:
-        df_resultat = generer_planning(ateliers, teams)
+        df_resultat = generer(ateliers, teams, data.get('poules', 1))
         # Conversion du DataFrame en dictionnaire (records) pour JSON
         result = df_resultat.fillna("").to_dict(orient="records")
         return jsonify(result)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
     except Exception as e:
         return jsonify({"detail": f"Erreur lors de la génération : {str(e)}"}), 500
 
@@ -62,9 +101,9 @@ def export_csv():
         return jsonify({"detail": "Listes vides."}), 400
 
     try:
-        df = generer_planning(ateliers, teams)
-        # Encodage en bytes pour send_file
-        output = io.BytesIO()
+        df = generer(ateliers, teams, data.get('poules', 1))
+        # Encodage en bytes pour send_file (fichier temporaire au-delà du seuil mémoire)
+        output = fichier_temporaire()
         df.to_csv(output, index=False, sep=';', encoding='utf-8-sig')
         output.seek(0)
         
@@ -74,6 +113,8 @@ def export_csv():
             as_attachment=True,
             download_name="planning_tournoi.csv"
         )
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
     except Exception as e:
         return jsonify({"detail": str(e)}), 500
 
@@ -94,15 +135,11 @@ def export_excel():
         return jsonify({"detail": "Listes vides."}), 400
 
     try:
-        df = generer_planning(ateliers, teams)
-        plannings = conversions_par_equipe(df)
-        
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            for equipe, df_eq in plannings.items():
-                sheet_name = equipe[:30].replace(":", "").replace("/", "")
-                df_eq.to_excel(writer, sheet_name=sheet_name, index=False)
-        
+        df = generer(ateliers, teams, data.get('poules', 1))
+
+        # Export en flux (équipes traitées par lots, lignes écrites au fil du parcours), déversé sur disque au-delà du seuil mémoire
+        output = fichier_temporaire()
+        exporter_excel_equipes(df, output)
         output.seek(0)
         
         return send_file(
@@ -111,10 +148,236 @@ def export_excel():
             as_attachment=True,
             download_name="plannings_equipes.xlsx"
         )
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
     except Exception as e:
         return jsonify({"detail": str(e)}), 500
 
 
+@app.route("/api/tournoi", methods=['POST'])
+def demarrer_tournoi():
+    """
+    Démarre un tournoi : génère le planning et initialise la saisie des résultats.
+    Attends un JSON avec 'teams' et 'ateliers' (et optionnellement 'poules').
+    """
+    data = request.get_json()
+    if not data:
+        return jsonify({"detail": "Données manquantes"}), 400
+
+    teams = [t.strip() for t in data.get('teams', []) if t.strip()]
+    ateliers = [a.strip() for a in data.get('ateliers', []) if a.strip()]
+
+    if not teams or not ateliers:
+        return jsonify({"detail": "Les listes d'équipes et d'ateliers ne peuvent pas être vides."}), 400
+
+    try:
+        df_resultat = generer(ateliers, teams, data.get('poules', 1))
+        planning_json = json.dumps(
+            df_resultat.fillna("").to_dict(orient="records"), ensure_ascii=False
+        ).encode("utf-8")
+        resultats = TableauResultats(df_resultat, teams)
+
+        with verrou_tournoi:
+            tournoi_courant["planning"] = df_resultat
+            tournoi_courant["planning_json"] = planning_json
+            tournoi_courant["resultats"] = resultats
+            tournoi_courant["tour"] = None
+            tournoi_courant["version_planning"] += 1
+            version = tournoi_courant["version_planning"]
+            # Simple notification : les écrans rechargent le planning via /api/planning.
+            # Publiée sous le verrou : les événements suivent l'ordre des changements d'état.
+            diffuseur.publier("planning", {"version": version, "nb_tours": len(df_resultat)})
+        return Response(planning_json, mimetype="application/json")
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+    except Exception as e:
+        return jsonify({"detail": f"Erreur lors de la génération : {str(e)}"}), 500
+
+
+@app.route("/api/planning", methods=['GET'])
+def lire_planning():
+    """
+    Retourne l'état du tournoi en cours : version et planning, ainsi que le tour courant
+    (null tant qu'aucun tour n'est lancé). Rechargé par les écrans après un événement
+    'planning' ou 'resync'.
+    Le planning est sérialisé une seule fois par version (à la création du tournoi) :
+    seule l'enveloppe est recomposée à chaque appel.
+    """
+    with verrou_tournoi:
+        planning_json = tournoi_courant["planning_json"]
+        version = tournoi_courant["version_planning"]
+        tour = tournoi_courant["tour"]
+    if planning_json is None:
+        return jsonify({"detail": "Aucun tournoi en cours."}), 404
+
+    entete = f'{{"version":{version},"tour":{json.dumps(tour)},"planning":'.encode("utf-8")
+    return Response(entete + planning_json + b"}", mimetype="application/json")
+
+
+@app.route("/api/resultats", methods=['POST'])
+def saisir_resultat():
+    """
+    Enregistre le score d'un match du tournoi en cours.
+    Attends un JSON avec 'tour', 'atelier', 'score_a' et 'score_b'.
+    """
+    data = request.get_json()
+    if not data:
+        return jsonify({"detail": "Données manquantes"}), 400
+
+    resultats = tournoi_courant["resultats"]
+    if resultats is None:
+        return jsonify({"detail": "Aucun tournoi en cours."}), 404
+
+    atelier = data.get('atelier')
+    if not isinstance(atelier, str):
+        return jsonify({"detail": "L'atelier doit être un texte."}), 400
+
+    try:
+        match = resultats.enregistrer_score(data.get('tour'), atelier, data.get('score_a'), data.get('score_b'))
+    except KeyError as e:
+        return jsonify({"detail": e.args[0]}), 404
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    # Delta : le match et les statistiques des deux équipes concernées (sans rang)
+    lignes = [resultats.statistiques(eq) for eq in (match["Equipe A"], match["Equipe B"])]
+    diffuseur.publier("resultat", {"version": resultats.version, "match": match, "equipes": lignes})
+    return jsonify(match)
+
+
+@app.route("/api/tour", methods=['POST'])
+def changer_tour():
+    """
+    Définit le tour en cours du tournoi et le diffuse aux écrans abonnés.
+    Attends un JSON avec 'tour'.
+    """
+    data = request.get_json()
+    if not data:
+        return jsonify({"detail": "Données manquantes"}), 400
+
+    try:
+        tour = valider_entier(data.get('tour'), "Le tour")
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+
+    with verrou_tournoi:
+        planning = tournoi_courant["planning"]
+        if planning is None:
+            return jsonify({"detail": "Aucun tournoi en cours."}), 404
+
+        lignes = planning[planning["Tour"] == tour]
+        if lignes.empty:
+            return jsonify({"detail": f"Le tour {tour} n'existe pas."}), 404
+
+        ligne = lignes.fillna("").to_dict(orient="records")[0]
+        tournoi_courant["tour"] = tour
+        diffuseur.publier("tour", ligne)
+    return jsonify(ligne)
+
+
+@app.route("/api/stream", methods=['GET'])
+def flux_evenements():
+    """
+    Flux Server-Sent Events des mises à jour du tournoi en cours. Événements :
+    - 'planning' : nouveau planning ({version, nb_tours}), à recharger via /api/planning ;
+    - 'tour' : changement de tour (ligne du planning du tour courant) ;
+    - 'resultat' : score saisi ({version, match, equipes}), avec les statistiques des
+      deux équipes sans leur rang (qui dépend des autres équipes) : le classement
+      officiel, départage compris, se relit via /api/classement ;
+    - 'resync' : état complet à recharger (/api/planning, /api/classement). Envoyé en
+      premier à chaque connexion, sauf si l'en-tête Last-Event-ID (reconnexion
+      automatique du navigateur) montre qu'aucun événement n'a été manqué, ainsi
+      qu'aux clients trop lents dont le tampon a débordé.
+    """
+    dernier_id = request.headers.get("Last-Event-ID", "").strip()
+    abonnement = diffuseur.abonner(int(dernier_id) if dernier_id.isdigit() else None)
+    return Response(
+        stream_with_context(diffuseur.flux(abonnement)),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.route("/api/classement", methods=['GET'])
+def lire_classement():
+    """
+    Retourne le classement du tournoi en cours.
+    Le JSON est sérialisé une seule fois par version des résultats (cache porté par
+    le TableauResultats) puis resservi tel quel.
+    """
+    resultats = tournoi_courant["resultats"]
+    if resultats is None:
+        return jsonify({"detail": "Aucun tournoi en cours."}), 404
+
+    return Response(resultats.classement_json(), mimetype="application/json")
+
+
+def lire_fichier_importe(champ: str):
+    """
+    Lit les noms du fichier envoyé dans le champ multipart donné (None si absent).
+    Le fichier est parcouru ligne par ligne depuis le flux de l'upload.
+    """
+    fichier = request.files.get(champ)
+    if fichier is None or not fichier.filename:
+        return None
+    return lire_noms(fichier.stream, fichier.filename)
+
+
+@app.route("/api/import", methods=['POST'])
+def importer_fichiers():
+    """
+    Importe les listes d'équipes et/ou d'ateliers depuis des fichiers CSV ou XLSX.
+    Attends un formulaire multipart avec les fichiers 'teams' et/ou 'ateliers'.
+    """
+    try:
+        teams = lire_fichier_importe('teams')
+        ateliers = lire_fichier_importe('ateliers')
+    except HTTPException:
+        # Requête trop volumineuse (413) : gérée par le errorhandler
+        raise
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+    except Exception as e:
+        return jsonify({"detail": f"Fichier illisible : {str(e)}"}), 400
+
+    if teams is None and ateliers is None:
+        return jsonify({"detail": "Aucun fichier reçu."}), 400
+
+    return jsonify({"teams": teams or [], "ateliers": ateliers or []})
+
+
+@app.route("/api/import/generate", methods=['POST'])
+def importer_et_generer():
+    """
+    Importe les fichiers d'équipes et d'ateliers puis génère directement le planning.
+    Attends un formulaire multipart avec les fichiers 'teams' et 'ateliers'
+    (et optionnellement le champ 'poules').
+    """
+    try:
+        teams = lire_fichier_importe('teams')
+        ateliers = lire_fichier_importe('ateliers')
+    except HTTPException:
+        # Requête trop volumineuse (413) : gérée par le errorhandler
+        raise
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+    except Exception as e:
+        return jsonify({"detail": f"Fichier illisible : {str(e)}"}), 400
+
+    if not teams or not ateliers:
+        return jsonify({"detail": "Les listes d'équipes et d'ateliers ne peuvent pas être vides."}), 400
+
+    try:
+        df_resultat = generer(ateliers, teams, request.form.get('poules', 1))
+        result = df_resultat.fillna("").to_dict(orient="records")
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({"detail": str(e)}), 400
+    except Exception as e:
+        return jsonify({"detail": f"Erreur lors de la génération : {str(e)}"}), 500
+
+
 if __name__ == '__main__':
     # Mode développement
-    app.run(debug=True, port=8000)
+    # threaded=True : chaque client du flux SSE occupe un thread
+    app.run(debug=True, port=8000, threaded=True)